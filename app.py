@@ -1,11 +1,11 @@
 
-from flask import Flask, render_template_string
+import os
+from flask import Flask, Response
 
 app = Flask(__name__)
 
-@app.route('/')
-def index():
-    return render_template_string('''
+# The page has no template variables, so render it once and serve the bytes
+_INDEX_BYTES = app.jinja_env.from_string('''
     <!DOCTYPE html>
     <html>
     <head><title>Blog Publisher - Under Construction</title></head>
@@ -15,8 +15,13 @@ def index():
         <p>This is the minimal starting configuration.</p>
     </body>
     </html>
-    ''')
+    ''').render().encode('utf-8')
+
+@app.route('/')
+def index():
+    return Response(_INDEX_BYTES, mimetype='text/html')
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # The Werkzeug debugger runs arbitrary code, so only enable it when developing
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_ENV') == 'development')
 EOF
@@ -2,15 +2,18 @@
 """API clients for publishing to various blog platforms."""
 
 # blog_publisher/api/publishers.py
-import requests
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from ..models import Setting
+from ..models import Setting, split_csv
+from .wordpress import WordPressAPI
+
+# Blogger service built once per credentials object; building it is expensive
+_BLOGGER_SERVICE = {'creds': None, 'service': None}
 
 class BlogAPI:
     """Main API class for publishing to different blog platforms."""
     
+    # The WordPress batch endpoint accepts at most this many requests per call
+    WORDPRESS_BATCH_LIMIT = 25
+    
     @staticmethod
     def publish_to_blogger(post, credentials):
         """
@@ -26,8 +29,20 @@ class BlogAPI:
         Raises:
             Exception: If publishing fails
         """
+        # Imported here so WordPress-only setups never load the Google client
+        from googleapiclient.discovery import build
+        from googleapiclient.errors import HttpError
+        
         try:
-            service = build('blogger', 'v3', credentials=credentials)
+            if _BLOGGER_SERVICE['creds'] is not credentials:
+                _BLOGGER_SERVICE['service'] = build(
+                    'blogger', 'v3',
+                    credentials=credentials,
+                    cache_discovery=False,
+                    static_discovery=True
+                )
+                _BLOGGER_SERVICE['creds'] = credentials
+            service = _BLOGGER_SERVICE['service']
             blog_id = Setting.get('blogger_blog_id')
             
             blog_post = {
@@ -36,13 +51,31 @@ class BlogAPI:
             }
             
             if post.tags:
-                blog_post['labels'] = [tag.strip() for tag in post.tags.split(',')]
+                blog_post['labels'] = split_csv(post.tags)
             
             result = service.posts().insert(blogId=blog_id, body=blog_post).execute()
             return result['id']
         except HttpError as e:
             raise Exception(f"Blogger API error: {e}")
     
+    @staticmethod
+    def _wordpress_post_data(post):
+        """Build the WordPress REST API body for a post."""
+        data = {
+            'title': post.title,
+            'content': post.content,
+            'status': 'publish'
+        }
+        
+        if post.categories:
+            # This is simplified - in reality, you'd need to map category names to IDs
+            data['categories'] = split_csv(post.categories)
+        
+        if post.tags:
+            data['tags'] = split_csv(post.tags)
+        
+        return data
+    
     @staticmethod
     def publish_to_wordpress(post):
         """
@@ -57,37 +90,21 @@ class BlogAPI:
         Raises:
             Exception: If publishing fails
         """
-        wp_url = Setting.get('wordpress_url')
-        wp_user = Setting.get('wordpress_username')
-        wp_password = Setting.get('wordpress_password')
-        
-        if not all([wp_url, wp_user, wp_password]):
+        client = WordPressAPI.get_session()
+        if client is None:
             raise Exception("WordPress credentials not configured")
         
-        api_url = f"{wp_url.rstrip('/')}/wp-json/wp/v2/posts"
+        session, base_url = client
+        api_url = f"{base_url}/wp-json/wp/v2/posts"
         
         headers = {
             'Content-Type': 'application/json',
         }
         
-        data = {
-            'title': post.title,
-            'content': post.content,
-            'status': 'publish'
-        }
-        
-        if post.categories:
-            # This is simplified - in reality, you'd need to map category names to IDs
-            data['categories'] = [cat.strip() for cat in post.categories.split(',')]
-        
-        if post.tags:
-            data['tags'] = [tag.strip() for tag in post.tags.split(',')]
-        
-        response = requests.post(
+        response = session.post(
             api_url,
             headers=headers,
-            json=data,
-            auth=(wp_user, wp_password),
+            json=BlogAPI._wordpress_post_data(post),
             timeout=30
         )
         
@@ -95,22 +112,92 @@ class BlogAPI:
             return response.json()['id']
         else:
             raise Exception(f"WordPress API error: {response.text}")
+    
+    @staticmethod
+    def publish_many_to_wordpress(posts):
+        """
+        Publish several posts to WordPress in a single batch request.
+        
+        Uses the REST API batch endpoint (WordPress 5.6+), which accepts at
+        most WORDPRESS_BATCH_LIMIT requests per call.
+        
+        Args:
+            posts: Post model instances
+            
+        Returns:
+            list: (external_id, error) pair for each post, in order
+            
+        Raises:
+            Exception: If the batch request itself fails
+        """
+        client = WordPressAPI.get_session()
+        if client is None:
+            raise Exception("WordPress credentials not configured")
+        
+        session, base_url = client
+        api_url = f"{base_url}/wp-json/batch/v1"
+        
+        data = {
+            'validation': 'require-all-validate',
+            'requests': [
+                {'method': 'POST', 'path': '/wp/v2/posts', 'body': BlogAPI._wordpress_post_data(post)}
+                for post in posts
+            ]
+        }
+        
+        response = session.post(api_url, json=data, timeout=60)
+        
+        if response.status_code not in (200, 207):
+            raise Exception(f"WordPress API error: {response.text}")
+        
+        responses = response.json().get('responses') or []
+        results = []
+        for index in range(len(posts)):
+            item = (responses[index] if index < len(responses) else None) or {}
+            body = item.get('body') or {}
+            if item.get('status') == 201:
+                results.append((body['id'], None))
+            else:
+                results.append((None, f"WordPress API error: {body.get('message', 'post not created')}"))
+        return results
 
 # blog_publisher/api/blogger.py
-"""Blogger-specific API functionality."""
+"""Blogger-specific API functionality.
+
+Google client libraries are imported inside the methods that use them so
+they are only loaded once Blogger is actually in use.
+"""
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import time
+from datetime import datetime
+import orjson
+from ..app import db
 from ..models import Setting
 
+# Credentials kept in memory between calls, with the time they are due for refresh
+_CREDS_CACHE = {'creds': None, 'refresh_at': 0.0}
+
 class BloggerAPI:
     """Blogger API client with OAuth2 support."""
     
     SCOPES = ['https://www.googleapis.com/auth/blogger']
     
+    # Fraction of a token's remaining lifetime after which it is refreshed
+    REFRESH_THRESHOLD = 0.5
+    
+    @staticmethod
+    def _credentials_to_dict(credentials):
+        """Serialize credentials for storage in settings."""
+        return {
+            'token': credentials.token,
+            'refresh_token': credentials.refresh_token,
+            'token_uri': credentials.token_uri,
+            'client_id': credentials.client_id,
+            'client_secret': credentials.client_secret,
+            'scopes': credentials.scopes,
+            'expiry': credentials.expiry.isoformat() if credentials.expiry else None
+        }
+    
     @classmethod
     def get_auth_url(cls):
         """
@@ -119,12 +206,15 @@ class BloggerAPI:
         Returns:
             str: Authorization URL for user to visit
         """
-        client_id = Setting.get('blogger_client_id')
-        client_secret = Setting.get('blogger_client_secret')
+        creds = Setting.get_many(['blogger_client_id', 'blogger_client_secret'])
+        client_id = creds['blogger_client_id']
+        client_secret = creds['blogger_client_secret']
         
         if not client_id or not client_secret:
             raise Exception("Blogger OAuth credentials not configured")
         
+        from google_auth_oauthlib.flow import Flow
+        
         flow = Flow.from_client_config(
             {
                 "web": {
@@ -146,6 +236,7 @@ class BloggerAPI:
         
         # Store state for validation
         Setting.set('blogger_oauth_state', state)
+        db.session.commit()
         
         return authorization_url
     
@@ -165,8 +256,11 @@ class BloggerAPI:
         if state != stored_state:
             raise Exception("Invalid OAuth state")
         
-        client_id = Setting.get('blogger_client_id')
-        client_secret = Setting.get('blogger_client_secret')
+        creds = Setting.get_many(['blogger_client_id', 'blogger_client_secret'])
+        client_id = creds['blogger_client_id']
+        client_secret = creds['blogger_client_secret']
+        
+        from google_auth_oauthlib.flow import Flow
         
         flow = Flow.from_client_config(
             {
@@ -186,17 +280,12 @@ class BloggerAPI:
         credentials = flow.credentials
         
         # Store credentials securely (in production, use proper encryption)
-        creds_data = {
-            'token': credentials.token,
-            'refresh_token': credentials.refresh_token,
-            'token_uri': credentials.token_uri,
-            'client_id': credentials.client_id,
-            'client_secret': credentials.client_secret,
-            'scopes': credentials.scopes
-        }
+        creds_data = cls._credentials_to_dict(credentials)
+        Setting.set('blogger_credentials', orjson.dumps(creds_data).decode())
+        db.session.commit()
         
-        import json
-        Setting.set('blogger_credentials', json.dumps(creds_data))
+        # Drop any cached credentials so the new ones are picked up
+        _CREDS_CACHE['creds'] = None
         
         return True
     
@@ -205,50 +294,108 @@ class BloggerAPI:
         """
         Get stored Blogger credentials.
         
+        Credentials are cached in memory and refreshed once a fraction of
+        their remaining lifetime has passed, rather than being rebuilt from
+        settings on every call.
+        
         Returns:
             Credentials: Google OAuth2 credentials or None
         """
-        creds_json = Setting.get('blogger_credentials')
-        if not creds_json:
-            return None
-        
-        import json
-        creds_data = json.loads(creds_json)
-        
-        credentials = Credentials(
-            token=creds_data['token'],
-            refresh_token=creds_data['refresh_token'],
-            token_uri=creds_data['token_uri'],
-            client_id=creds_data['client_id'],
-            client_secret=creds_data['client_secret'],
-            scopes=creds_data['scopes']
-        )
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        
+        credentials = _CREDS_CACHE['creds']
+        if credentials is not None:
+            if time.time() < _CREDS_CACHE['refresh_at']:
+                return credentials
+            needs_refresh = True
+        else:
+            creds_json = Setting.get('blogger_credentials')
+            if not creds_json:
+                return None
+            
+            creds_data = orjson.loads(creds_json)
+            expiry = creds_data.get('expiry')
+            
+            credentials = Credentials(
+                token=creds_data['token'],
+                refresh_token=creds_data['refresh_token'],
+                token_uri=creds_data['token_uri'],
+                client_id=creds_data['client_id'],
+                client_secret=creds_data['client_secret'],
+                scopes=creds_data['scopes'],
+                expiry=datetime.fromisoformat(expiry) if expiry else None
+            )
+            needs_refresh = credentials.expiry is None or credentials.expired
         
         # Refresh if needed
-        if credentials.expired:
+        if needs_refresh:
             credentials.refresh(Request())
             # Update stored credentials
-            updated_creds = {
-                'token': credentials.token,
-                'refresh_token': credentials.refresh_token,
-                'token_uri': credentials.token_uri,
-                'client_id': credentials.client_id,
-                'client_secret': credentials.client_secret,
-                'scopes': credentials.scopes
-            }
-            Setting.set('blogger_credentials', json.dumps(updated_creds))
+            Setting.set('blogger_credentials', orjson.dumps(cls._credentials_to_dict(credentials)).decode())
+            db.session.commit()
+        
+        remaining = (credentials.expiry - datetime.utcnow()).total_seconds()
+        _CREDS_CACHE['creds'] = credentials
+        _CREDS_CACHE['refresh_at'] = time.time() + max(remaining, 0) * cls.REFRESH_THRESHOLD
         
         return credentials
 
 # blog_publisher/api/wordpress.py
 """WordPress-specific API functionality."""
 
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..models import Setting
 
+def _build_session(auth):
+    """Create an authenticated session that reuses pooled keep-alive connections."""
+    session = requests.Session()
+    session.auth = auth
+    session.mount('https://', HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    ))
+    return session
+
+# (base URL, endpoint) -> (fetched at, ETag, parsed body) for list endpoints
+_WP_CACHE = {}
+
 class WordPressAPI:
     """WordPress REST API client."""
     
+    # Seconds a fetched list is served before it is revalidated with the site
+    CACHE_TTL = 60
+    
+    # (credentials, session, base URL) for the most recently seen configuration
+    _CREDS_TUPLE = None
+    
+    @classmethod
+    def get_session(cls):
+        """
+        Get an authenticated session and base URL for the configured site.
+        
+        The session is rebuilt only when the stored credentials change.
+        
+        Returns:
+            tuple: (requests.Session, base URL) or None if not configured
+        """
+        creds = Setting.get_many(['wordpress_url', 'wordpress_username', 'wordpress_password'])
+        key = (creds['wordpress_url'], creds['wordpress_username'], creds['wordpress_password'])
+        
+        if not all(key):
+            return None
+        
+        if cls._CREDS_TUPLE is None or cls._CREDS_TUPLE[0] != key:
+            wp_url, wp_user, wp_password = key
+            session = _build_session((wp_user, wp_password))
+            cls._CREDS_TUPLE = (key, session, wp_url.rstrip('/'))
+        
+        return cls._CREDS_TUPLE[1:]
+    
     @classmethod
     def test_connection(cls):
         """
@@ -257,74 +404,86 @@ class WordPressAPI:
         Returns:
             dict: Connection test results
         """
-        wp_url = Setting.get('wordpress_url')
-        wp_user = Setting.get('wordpress_username')
-        wp_password = Setting.get('wordpress_password')
-        
-        if not all([wp_url, wp_user, wp_password]):
+        client = cls.get_session()
+        if client is None:
             return {'success': False, 'error': 'WordPress credentials not configured'}
         
+        session, base_url = client
         try:
             # Test with a simple GET request to posts endpoint
-            api_url = f"{wp_url.rstrip('/')}/wp-json/wp/v2/categories"
-            response = requests.get(
-                api_url,
-                auth=(wp_user, wp_password),
+            response = session.get(
+                f"{base_url}/wp-json/wp/v2/posts",
+                params={'per_page': 1},
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return {'success': True, 'message': 'WordPress connection successful'}
             else:
-                return []
+                return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
                 
-        except requests.exceptions.RequestException:
-            return []
+        except requests.exceptions.RequestException as e:
+            return {'success': False, 'error': f'Connection error: {str(e)}'}
     
     @classmethod
-    def get_tags(cls):
+    def _get_list(cls, endpoint):
         """
-        Get WordPress tags.
+        Fetch a list endpoint, reusing the cached copy while it is fresh.
         
+        Stale entries are revalidated with If-None-Match, so an unchanged
+        list costs a bodiless 304 instead of a full download.
+        
+        Args:
+            endpoint: REST endpoint under /wp-json/wp/v2/
+            
         Returns:
-            list: Available WordPress tags
+            list: Parsed response body; if the refresh fails, the last cached
+            copy, or an empty list when there is none
         """
-        wp_url = Setting.get('wordpress_url')
-        wp_user = Setting.get('wordpress_username')
-        wp_password = Setting.get('wordpress_password')
-        
-        if not all([wp_url, wp_user, wp_password]):
+        client = cls.get_session()
+        if client is None:
             return []
         
+        session, base_url = client
+        cache_key = (base_url, endpoint)
+        cached = _WP_CACHE.get(cache_key)
+        
+        if cached and time.time() - cached[0] < cls.CACHE_TTL:
+            return cached[2]
+        
+        headers = {}
+        if cached and cached[1]:
+            headers['If-None-Match'] = cached[1]
+        
         try:
-            api_url = f"{wp_url.rstrip('/')}/wp-json/wp/v2/tags"
-            response = requests.get(
-                api_url,
-                auth=(wp_user, wp_password),
+            response = session.get(
+                f"{base_url}/wp-json/wp/v2/{endpoint}",
+                headers=headers,
                 timeout=10
             )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return []
-                
         except requests.exceptions.RequestException:
-            return []posts"
-            response = requests.get(
-                api_url,
-                auth=(wp_user, wp_password),
-                params={'per_page': 1},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                return {'success': True, 'message': 'WordPress connection successful'}
-            else:
-                return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
-                
-        except requests.exceptions.RequestException as e:
-            return {'success': False, 'error': f'Connection error: {str(e)}'}
+            # Serve the stale copy rather than nothing; the next call retries
+            return cached[2] if cached else []
+        
+        if response.status_code == 304 and cached:
+            _WP_CACHE[cache_key] = (time.time(), cached[1], cached[2])
+            return cached[2]
+        elif response.status_code == 200:
+            body = response.json()
+            _WP_CACHE[cache_key] = (time.time(), response.headers.get('ETag'), body)
+            return body
+        else:
+            return cached[2] if cached else []
+    
+    @classmethod
+    def get_tags(cls):
+        """
+        Get WordPress tags.
+        
+        Returns:
+            list: Available WordPress tags
+        """
+        return cls._get_list('tags')
     
     @classmethod
     def get_categories(cls):
@@ -334,12 +493,4 @@ class WordPressAPI:
         Returns:
             list: Available WordPress categories
         """
-        wp_url = Setting.get('wordpress_url')
-        wp_user = Setting.get('wordpress_username')
-        wp_password = Setting.get('wordpress_password')
-        
-        if not all([wp_url, wp_user, wp_password]):
-            return []
-        
-        try:
-            api_url = f"{wp_url.rstrip('/')}/wp-json/wp/v2/
\ No newline at end of file
+        return cls._get_list('categories')
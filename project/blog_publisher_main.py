@@ -1,21 +1,91 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, jsonify, session, g, has_app_context
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
 from werkzeug.security import generate_password_hash, check_password_hash
 import os
+import re
 import json
 import sqlite3
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-app = Flask(__name__)
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json module."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class BlogPublisherApp(Flask):
+    json_provider_class = OrjsonProvider
+
+app = BlogPublisherApp(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-change-this'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///blog_publisher.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['COMPRESS_MIN_SIZE'] = 512
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
 
 db = SQLAlchemy(app)
+Compress(app)
+
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers run alongside the writer and makes each commit a cheap append
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-65536')
+    cursor.close()
+
+# Shared HTTP session so repeated REST calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+# Blogger service built once per credentials object; building it is expensive
+_BLOGGER_SERVICE = {'creds': None, 'service': None}
+
+# Dashboard listing
+POSTS_PER_PAGE = 25
+POST_PREVIEW_LENGTH = 150
+
+# Seconds browsers may reuse /api/tags and /api/categories without revalidating
+LIST_CACHE_MAX_AGE = 30
+
+# Upper bound on concurrent publishes; kept below the adapter's pool_maxsize
+PUBLISH_WORKERS = 8
+
+# Matches one comma-separated label with surrounding whitespace trimmed
+_CSV_RE = re.compile(r'[^,\s][^,]*[^,\s]|[^,\s]')
+
+def split_csv(value):
+    """Split a comma-separated label string into trimmed, non-empty names."""
+    return _CSV_RE.findall(value) if value else []
+
+def _request_settings():
+    """Return the settings snapshot loaded for the current request, if any."""
+    if has_app_context() and 'settings' in g:
+        return g.settings
+    return None
 
 # Database Models
 class Setting(db.Model):
@@ -23,10 +93,26 @@ class Setting(db.Model):
     key = db.Column(db.String(100), unique=True, nullable=False)
     value = db.Column(db.Text)
     
+    @staticmethod
+    def load_all():
+        return dict(db.session.query(Setting.key, Setting.value).all())
+    
     @staticmethod
     def get(key, default=None):
-        setting = Setting.query.filter_by(key=key).first()
-        return setting.value if setting else default
+        snapshot = _request_settings()
+        if snapshot is not None:
+            value = snapshot.get(key)
+        else:
+            setting = Setting.query.filter_by(key=key).first()
+            value = setting.value if setting else None
+        return value if value is not None else default
+    
+    @staticmethod
+    def get_many(keys):
+        snapshot = _request_settings()
+        if snapshot is None:
+            snapshot = {s.key: s.value for s in Setting.query.filter(Setting.key.in_(keys)).all()}
+        return {key: snapshot.get(key) for key in keys}
     
     @staticmethod
     def set(key, value):
@@ -37,6 +123,33 @@ class Setting(db.Model):
             setting = Setting(key=key, value=value)
             db.session.add(setting)
         db.session.commit()
+        Setting._remember({key: value})
+    
+    @staticmethod
+    def set_many(mapping):
+        existing = {s.key: s for s in Setting.query.filter(Setting.key.in_(mapping)).all()}
+        for key, value in mapping.items():
+            if key in existing:
+                existing[key].value = value
+            else:
+                db.session.add(Setting(key=key, value=value))
+        db.session.commit()
+        Setting._remember(mapping)
+    
+    @staticmethod
+    def _remember(mapping):
+        snapshot = _request_settings()
+        if snapshot is not None:
+            snapshot.update(mapping)
+
+def commit_list_change(model):
+    """Commit pending changes to the tag or category list along with a new version for its ETag."""
+    Setting.set(f'{model.__tablename__}_mtime', str(time.time()))
+
+# Settings are read once per request; each gunicorn worker sees other workers' writes on its next request
+@app.before_request
+def load_settings():
+    g.settings = Setting.load_all()
 
 class AvailableTag(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -47,30 +160,36 @@ class AvailableTag(db.Model):
     
     @staticmethod
     def get_all_tags():
-        return AvailableTag.query.order_by(AvailableTag.usage_count.desc()).all()
+        return db.session.execute(db.select(AvailableTag).order_by(AvailableTag.usage_count.desc())).scalars().all()
     
     @staticmethod
     def add_tag(name, description=''):
-        tag = AvailableTag.query.filter_by(name=name.strip()).first()
-        if not tag:
-            tag = AvailableTag(name=name.strip(), description=description)
-            db.session.add(tag)
-            db.session.commit()
-        return tag
+        name = name.strip()
+        # INSERT OR IGNORE: an existing name is kept without raising IntegrityError
+        db.session.execute(
+            sqlite_insert(AvailableTag)
+            .values(name=name, description=description)
+            .on_conflict_do_nothing(index_elements=['name'])
+        )
+        commit_list_change(AvailableTag)
+        return AvailableTag.query.filter_by(name=name).first()
     
     @staticmethod
     def increment_usage(tag_names):
         if not tag_names:
             return
-        tag_list = [tag.strip() for tag in tag_names.split(',') if tag.strip()]
-        for tag_name in tag_list:
-            tag = AvailableTag.query.filter_by(name=tag_name).first()
-            if tag:
-                tag.usage_count += 1
-            else:
-                # Auto-add new tags
-                AvailableTag.add_tag(tag_name)
-        db.session.commit()
+        tag_list = list(dict.fromkeys(split_csv(tag_names)))
+        existing = {tag.name for tag in AvailableTag.query.filter(AvailableTag.name.in_(tag_list)).all()}
+        if existing:
+            AvailableTag.query.filter(AvailableTag.name.in_(existing)).update(
+                {AvailableTag.usage_count: AvailableTag.usage_count + 1},
+                synchronize_session=False
+            )
+        # Auto-add new tags
+        missing = [name for name in tag_list if name not in existing]
+        if missing:
+            db.session.bulk_insert_mappings(AvailableTag, [{'name': name, 'usage_count': 1} for name in missing])
+        commit_list_change(AvailableTag)
 
 class AvailableCategory(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -81,48 +200,74 @@ class AvailableCategory(db.Model):
     
     @staticmethod
     def get_all_categories():
-        return AvailableCategory.query.order_by(AvailableCategory.usage_count.desc()).all()
+        return db.session.execute(db.select(AvailableCategory).order_by(AvailableCategory.usage_count.desc())).scalars().all()
     
     @staticmethod
     def add_category(name, description=''):
-        category = AvailableCategory.query.filter_by(name=name.strip()).first()
-        if not category:
-            category = AvailableCategory(name=name.strip(), description=description)
-            db.session.add(category)
-            db.session.commit()
-        return category
+        name = name.strip()
+        # INSERT OR IGNORE: an existing name is kept without raising IntegrityError
+        db.session.execute(
+            sqlite_insert(AvailableCategory)
+            .values(name=name, description=description)
+            .on_conflict_do_nothing(index_elements=['name'])
+        )
+        commit_list_change(AvailableCategory)
+        return AvailableCategory.query.filter_by(name=name).first()
     
     @staticmethod
     def increment_usage(category_names):
         if not category_names:
             return
-        category_list = [cat.strip() for cat in category_names.split(',') if cat.strip()]
-        for category_name in category_list:
-            category = AvailableCategory.query.filter_by(name=category_name).first()
-            if category:
-                category.usage_count += 1
-            else:
-                # Auto-add new categories
-                AvailableCategory.add_category(category_name)
-        db.session.commit()
+        category_list = list(dict.fromkeys(split_csv(category_names)))
+        existing = {cat.name for cat in AvailableCategory.query.filter(AvailableCategory.name.in_(category_list)).all()}
+        if existing:
+            AvailableCategory.query.filter(AvailableCategory.name.in_(existing)).update(
+                {AvailableCategory.usage_count: AvailableCategory.usage_count + 1},
+                synchronize_session=False
+            )
+        # Auto-add new categories
+        missing = [name for name in category_list if name not in existing]
+        if missing:
+            db.session.bulk_insert_mappings(AvailableCategory, [{'name': name, 'usage_count': 1} for name in missing])
+        commit_list_change(AvailableCategory)
 
 class Post(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
-    status = db.Column(db.String(20), default='draft')  # draft, published, scheduled
+    status = db.Column(db.String(20), default='draft', index=True)  # draft, published, scheduled
     created_date = db.Column(db.DateTime, default=datetime.utcnow)
     published_date = db.Column(db.DateTime)
-    blog_target = db.Column(db.String(50))  # blogger, wordpress
+    blog_target = db.Column(db.String(50), index=True)  # blogger, wordpress
     external_id = db.Column(db.String(100))  # ID from the blog platform
     tags = db.Column(db.String(500))
     categories = db.Column(db.String(500))
+    
+    __table_args__ = (
+        db.Index('ix_post_created_desc', created_date.desc()),
+        db.Index('ix_post_status_created', status, created_date.desc()),
+    )
 
 class BlogAPI:
+    # The WordPress batch endpoint accepts at most this many requests per call
+    WORDPRESS_BATCH_LIMIT = 25
+    
     @staticmethod
     def publish_to_blogger(post, credentials):
+        # Imported here so WordPress-only setups never load the Google client
+        from googleapiclient.discovery import build
+        from googleapiclient.errors import HttpError
+        
         try:
-            service = build('blogger', 'v3', credentials=credentials)
+            if _BLOGGER_SERVICE['creds'] is not credentials:
+                _BLOGGER_SERVICE['service'] = build(
+                    'blogger', 'v3',
+                    credentials=credentials,
+                    cache_discovery=False,
+                    static_discovery=True
+                )
+                _BLOGGER_SERVICE['creds'] = credentials
+            service = _BLOGGER_SERVICE['service']
             blog_id = Setting.get('blogger_blog_id')
             
             blog_post = {
@@ -131,7 +276,7 @@ class BlogAPI:
             }
             
             if post.tags:
-                blog_post['labels'] = [tag.strip() for tag in post.tags.split(',')]
+                blog_post['labels'] = split_csv(post.tags)
             
             result = service.posts().insert(blogId=blog_id, body=blog_post).execute()
             return result['id']
@@ -139,20 +284,7 @@ class BlogAPI:
             raise Exception(f"Blogger API error: {e}")
     
     @staticmethod
-    def publish_to_wordpress(post):
-        wp_url = Setting.get('wordpress_url')
-        wp_user = Setting.get('wordpress_username')
-        wp_password = Setting.get('wordpress_password')
-        
-        if not all([wp_url, wp_user, wp_password]):
-            raise Exception("WordPress credentials not configured")
-        
-        api_url = f"{wp_url.rstrip('/')}/wp-json/wp/v2/posts"
-        
-        headers = {
-            'Content-Type': 'application/json',
-        }
-        
+    def _wordpress_post_data(post):
         data = {
             'title': post.title,
             'content': post.content,
@@ -161,22 +293,84 @@ class BlogAPI:
         
         if post.categories:
             # This is simplified - in reality, you'd need to map category names to IDs
-            data['categories'] = [cat.strip() for cat in post.categories.split(',')]
+            data['categories'] = split_csv(post.categories)
         
         if post.tags:
-            data['tags'] = [tag.strip() for tag in post.tags.split(',')]
+            data['tags'] = split_csv(post.tags)
+        
+        return data
+    
+    @staticmethod
+    def publish_to_wordpress(post):
+        creds = Setting.get_many(['wordpress_url', 'wordpress_username', 'wordpress_password'])
+        wp_url = creds['wordpress_url']
+        wp_user = creds['wordpress_username']
+        wp_password = creds['wordpress_password']
         
-        response = requests.post(
+        if not all([wp_url, wp_user, wp_password]):
+            raise Exception("WordPress credentials not configured")
+        
+        api_url = f"{wp_url.rstrip('/')}/wp-json/wp/v2/posts"
+        
+        headers = {
+            'Content-Type': 'application/json',
+        }
+        
+        response = _SESSION.post(
             api_url,
             headers=headers,
-            json=data,
-            auth=(wp_user, wp_password)
+            json=BlogAPI._wordpress_post_data(post),
+            auth=(wp_user, wp_password),
+            timeout=30
         )
         
         if response.status_code == 201:
             return response.json()['id']
         else:
             raise Exception(f"WordPress API error: {response.text}")
+    
+    @staticmethod
+    def publish_many_to_wordpress(posts):
+        # One round trip for up to WORDPRESS_BATCH_LIMIT posts (needs WordPress 5.6+).
+        # Returns an (external_id, error) pair per post, in order.
+        creds = Setting.get_many(['wordpress_url', 'wordpress_username', 'wordpress_password'])
+        wp_url = creds['wordpress_url']
+        wp_user = creds['wordpress_username']
+        wp_password = creds['wordpress_password']
+        
+        if not all([wp_url, wp_user, wp_password]):
+            raise Exception("WordPress credentials not configured")
+        
+        api_url = f"{wp_url.rstrip('/')}/wp-json/batch/v1"
+        
+        data = {
+            'validation': 'require-all-validate',
+            'requests': [
+                {'method': 'POST', 'path': '/wp/v2/posts', 'body': BlogAPI._wordpress_post_data(post)}
+                for post in posts
+            ]
+        }
+        
+        response = _SESSION.post(
+            api_url,
+            json=data,
+            auth=(wp_user, wp_password),
+            timeout=60
+        )
+        
+        if response.status_code not in (200, 207):
+            raise Exception(f"WordPress API error: {response.text}")
+        
+        responses = response.json().get('responses') or []
+        results = []
+        for index in range(len(posts)):
+            item = (responses[index] if index < len(responses) else None) or {}
+            body = item.get('body') or {}
+            if item.get('status') == 201:
+                results.append((body['id'], None))
+            else:
+                results.append((None, f"WordPress API error: {body.get('message', 'post not created')}"))
+        return results
 
 # Routes
 @app.route('/')
@@ -185,8 +379,19 @@ def index():
     if not Setting.get('configured'):
         return redirect(url_for('setup'))
     
-    posts = Post.query.order_by(Post.created_date.desc()).all()
-    return render_template('index.html', posts=posts)
+    # Only select what the dashboard cards show; full content stays in the database
+    page = request.args.get('page', 1, type=int)
+    posts = Post.query.with_entities(
+        Post.id,
+        Post.title,
+        Post.status,
+        Post.created_date,
+        Post.published_date,
+        Post.blog_target,
+        db.func.substr(Post.content, 1, POST_PREVIEW_LENGTH).label('preview'),
+        db.func.length(Post.content).label('content_length')
+    ).order_by(Post.created_date.desc()).paginate(page=page, per_page=POSTS_PER_PAGE, error_out=False)
+    return render_template('index.html', posts=posts, preview_length=POST_PREVIEW_LENGTH)
 
 @app.route('/setup')
 def setup():
@@ -196,18 +401,19 @@ def setup():
 def setup_post():
     # Save blog configuration
     blog_type = request.form.get('blog_type')
-    Setting.set('blog_type', blog_type)
+    form_settings = {'blog_type': blog_type}
     
     if blog_type == 'blogger':
-        Setting.set('blogger_blog_id', request.form.get('blogger_blog_id'))
-        Setting.set('blogger_client_id', request.form.get('blogger_client_id'))
-        Setting.set('blogger_client_secret', request.form.get('blogger_client_secret'))
+        form_settings['blogger_blog_id'] = request.form.get('blogger_blog_id')
+        form_settings['blogger_client_id'] = request.form.get('blogger_client_id')
+        form_settings['blogger_client_secret'] = request.form.get('blogger_client_secret')
     elif blog_type == 'wordpress':
-        Setting.set('wordpress_url', request.form.get('wordpress_url'))
-        Setting.set('wordpress_username', request.form.get('wordpress_username'))
-        Setting.set('wordpress_password', request.form.get('wordpress_password'))
+        form_settings['wordpress_url'] = request.form.get('wordpress_url')
+        form_settings['wordpress_username'] = request.form.get('wordpress_username')
+        form_settings['wordpress_password'] = request.form.get('wordpress_password')
     
-    Setting.set('configured', 'true')
+    form_settings['configured'] = 'true'
+    Setting.set_many(form_settings)
     flash('Configuration saved successfully!', 'success')
     return redirect(url_for('index'))
 
@@ -225,17 +431,18 @@ def settings():
 @app.route('/settings', methods=['POST'])
 def settings_post():
     blog_type = request.form.get('blog_type')
-    Setting.set('blog_type', blog_type)
+    form_settings = {'blog_type': blog_type}
     
     if blog_type == 'blogger':
-        Setting.set('blogger_blog_id', request.form.get('blogger_blog_id'))
-        Setting.set('blogger_client_id', request.form.get('blogger_client_id'))
-        Setting.set('blogger_client_secret', request.form.get('blogger_client_secret'))
+        form_settings['blogger_blog_id'] = request.form.get('blogger_blog_id')
+        form_settings['blogger_client_id'] = request.form.get('blogger_client_id')
+        form_settings['blogger_client_secret'] = request.form.get('blogger_client_secret')
     elif blog_type == 'wordpress':
-        Setting.set('wordpress_url', request.form.get('wordpress_url'))
-        Setting.set('wordpress_username', request.form.get('wordpress_username'))
-        Setting.set('wordpress_password', request.form.get('wordpress_password'))
+        form_settings['wordpress_url'] = request.form.get('wordpress_url')
+        form_settings['wordpress_username'] = request.form.get('wordpress_username')
+        form_settings['wordpress_password'] = request.form.get('wordpress_password')
     
+    Setting.set_many(form_settings)
     flash('Settings updated successfully!', 'success')
     return redirect(url_for('settings'))
 
@@ -245,7 +452,7 @@ def new_post():
 
 @app.route('/edit_post/<int:post_id>')
 def edit_post(post_id):
-    post = Post.query.get_or_404(post_id)
+    post = db.get_or_404(Post, post_id)
     return render_template('editor.html', post=post)
 
 @app.route('/save_post', methods=['POST'])
@@ -253,7 +460,7 @@ def save_post():
     data = request.get_json()
     
     if data.get('id'):
-        post = Post.query.get(data['id'])
+        post = db.get_or_404(Post, data['id'])
         post.title = data['title']
         post.content = data['content']
         post.tags = data.get('tags', '')
@@ -283,7 +490,7 @@ def publish_post():
     if not post_id:
         return jsonify({'success': False, 'error': 'Post ID required'})
     
-    post = Post.query.get(post_id)
+    post = db.session.get(Post, post_id)
     if not post:
         return jsonify({'success': False, 'error': 'Post not found'})
     
@@ -308,24 +515,89 @@ def publish_post():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/publish_batch', methods=['POST'])
+def publish_batch():
+    data = request.get_json()
+    post_ids = data.get('ids') or []
+    
+    if not post_ids:
+        return jsonify({'success': False, 'error': 'Post IDs required'})
+    
+    if Setting.get('blog_type') != 'wordpress':
+        return jsonify({'success': False, 'error': 'Batch publishing requires WordPress'})
+    
+    posts = Post.query.filter(Post.id.in_(post_ids)).all()
+    
+    # Worker threads get their own app context; hand them this request's settings snapshot
+    settings = g.settings
+    
+    def publish(batch):
+        with app.app_context():
+            g.settings = settings
+            return BlogAPI.publish_many_to_wordpress(batch)
+    
+    # Each batch is a single request; batches beyond the first are sent concurrently
+    limit = BlogAPI.WORDPRESS_BATCH_LIMIT
+    batches = [posts[i:i + limit] for i in range(0, len(posts), limit)]
+    with ThreadPoolExecutor(max_workers=PUBLISH_WORKERS) as executor:
+        futures = [executor.submit(publish, batch) for batch in batches]
+    
+    results = {}
+    for batch, future in zip(batches, futures):
+        try:
+            outcomes = future.result()
+        except Exception as e:
+            outcomes = [(None, str(e))] * len(batch)
+        for post, (external_id, error) in zip(batch, outcomes):
+            if error:
+                results[post.id] = {'success': False, 'error': error}
+                continue
+            post.status = 'published'
+            post.published_date = datetime.utcnow()
+            post.external_id = str(external_id)
+            results[post.id] = {'success': True}
+    db.session.commit()
+    
+    return jsonify({'success': True, 'results': results})
+
 @app.route('/delete_post/<int:post_id>', methods=['POST'])
 def delete_post(post_id):
-    post = Post.query.get_or_404(post_id)
+    post = db.get_or_404(Post, post_id)
     db.session.delete(post)
     db.session.commit()
     flash('Post deleted successfully!', 'success')
     return redirect(url_for('index'))
 
 # Tag Management Routes
+def json_list_response(model):
+    """Return a tag or category list, answering unchanged revalidations with 304."""
+    # Every write to the list goes through commit_list_change, so its version is the validator
+    etag = Setting.get(f'{model.__tablename__}_mtime', '0')
+    
+    # Flask-Compress appends ':<algorithm>' to the ETags of responses it compressed
+    candidates = [etag] + [f'{etag}:{algorithm}' for algorithm in app.config['COMPRESS_ALGORITHM']]
+    if any(request.if_none_match.contains_weak(candidate) for candidate in candidates):
+        response = Response(status=304)
+    else:
+        # A plain body rather than a stream, so Flask-Compress can compress it
+        rows = db.session.execute(
+            db.select(model.name, model.usage_count, model.description)
+            .order_by(model.usage_count.desc())
+        ).mappings()
+        response = Response(orjson.dumps([dict(row) for row in rows]), mimetype='application/json')
+    
+    response.set_etag(etag, weak=True)
+    response.cache_control.private = True
+    response.cache_control.max_age = LIST_CACHE_MAX_AGE
+    return response
+
 @app.route('/api/tags')
 def get_tags():
-    tags = AvailableTag.get_all_tags()
-    return jsonify([{'name': tag.name, 'usage_count': tag.usage_count, 'description': tag.description} for tag in tags])
+    return json_list_response(AvailableTag)
 
 @app.route('/api/categories')
 def get_categories():
-    categories = AvailableCategory.get_all_categories()
-    return jsonify([{'name': cat.name, 'usage_count': cat.usage_count, 'description': cat.description} for cat in categories])
+    return json_list_response(AvailableCategory)
 
 @app.route('/manage_tags')
 def manage_tags():
@@ -342,16 +614,13 @@ def add_tag():
     if not tag_name:
         return jsonify({'success': False, 'error': 'Tag name is required'})
     
-    try:
-        tag = AvailableTag.add_tag(tag_name, description)
-        return jsonify({'success': True, 'tag': {
-            'id': tag.id,
-            'name': tag.name,
-            'description': tag.description,
-            'usage_count': tag.usage_count
-        }})
-    except Exception as e:
-        return jsonify({'success': False, 'error': 'Tag already exists'})
+    tag = AvailableTag.add_tag(tag_name, description)
+    return jsonify({'success': True, 'tag': {
+        'id': tag.id,
+        'name': tag.name,
+        'description': tag.description,
+        'usage_count': tag.usage_count
+    }})
 
 @app.route('/add_category', methods=['POST'])
 def add_category():
@@ -362,35 +631,44 @@ def add_category():
     if not category_name:
         return jsonify({'success': False, 'error': 'Category name is required'})
     
-    try:
-        category = AvailableCategory.add_category(category_name, description)
-        return jsonify({'success': True, 'category': {
-            'id': category.id,
-            'name': category.name,
-            'description': category.description,
-            'usage_count': category.usage_count
-        }})
-    except Exception as e:
-        return jsonify({'success': False, 'error': 'Category already exists'})
+    category = AvailableCategory.add_category(category_name, description)
+    return jsonify({'success': True, 'category': {
+        'id': category.id,
+        'name': category.name,
+        'description': category.description,
+        'usage_count': category.usage_count
+    }})
 
 @app.route('/delete_tag/<int:tag_id>', methods=['POST'])
 def delete_tag(tag_id):
-    tag = AvailableTag.query.get_or_404(tag_id)
+    tag = db.get_or_404(AvailableTag, tag_id)
     db.session.delete(tag)
-    db.session.commit()
+    commit_list_change(AvailableTag)
     return jsonify({'success': True})
 
 @app.route('/delete_category/<int:category_id>', methods=['POST'])
 def delete_category(category_id):
-    category = AvailableCategory.query.get_or_404(category_id)
+    category = db.get_or_404(AvailableCategory, category_id)
     db.session.delete(category)
-    db.session.commit()
+    commit_list_change(AvailableCategory)
     return jsonify({'success': True})
 
 # Initialize database
-@app.before_first_request
 def create_tables():
     db.create_all()
+    # create_all skips existing tables, so add any indexes missing from older databases
+    for index in Post.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+
+@app.cli.command('init-db')
+def init_db():
+    """Create database tables and indexes."""
+    create_tables()
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    with app.app_context():
+        create_tables()
+    # Werkzeug's server is for local development only; deploy with
+    # flask --app project.blog_publisher_main init-db, then
+    # gunicorn -k gevent -w 2 --worker-connections 1000 project.blog_publisher_main:app
+    app.run(debug=os.environ.get('FLASK_ENV') == 'development')
\ No newline at end of file
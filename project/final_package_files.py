@@ -24,7 +24,17 @@ if __name__ == '__main__':
     print(f"Debug mode: {debug}")
     print("Press Ctrl+C to stop the server")
     
-    app.run(host=host, port=port, debug=debug)
+    if debug:
+        # Werkzeug's reloader and debugger, one request at a time
+        app.run(host=host, port=port, debug=True)
+    else:
+        # Hand the process over to gunicorn so requests are served by several workers
+        os.execvp('gunicorn', [
+            'gunicorn',
+            '-w', str(os.cpu_count() or 1),
+            '-b', f'{host}:{port}',
+            f"blog_publisher:create_app('{config_name}')",
+        ])
 
 # MANIFEST.in
 include README.md
@@ -38,17 +48,53 @@ recursive-exclude * *.py[co]
 # blog_publisher/utils.py
 """Utility functions for the blog publisher."""
 
+import mmap
 import os
-import shutil
+import time
 from pathlib import Path
-from .models import Setting, Post, AvailableTag, AvailableCategory
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .models import Setting, Post, AvailableTag, AvailableCategory, link_post_tags
 from .app import db
-import json
+import orjson
+
+# Rows fetched per round trip while exporting
+BACKUP_BATCH_SIZE = 1000
+
+# Write buffer for backup files, so many small records become few large writes
+BACKUP_BUFFER_SIZE = 1024 * 1024
+
+def _stream_rows(*columns):
+    """Yield rows of the given columns as mappings, fetched in batches without ORM objects."""
+    return db.session.execute(
+        db.select(*columns).execution_options(yield_per=BACKUP_BATCH_SIZE)
+    ).mappings()
+
+def _write_json_array(f, records):
+    """Write records to a binary file as a JSON array, one record per line."""
+    f.write(b'[')
+    for index, record in enumerate(records):
+        f.write(b',\n  ' if index else b'\n  ')
+        f.write(orjson.dumps(record))
+    f.write(b'\n]')
+
+def _transaction():
+    """
+    Begin a transaction, or a savepoint inside the caller's so their pending work is not committed.
+    
+    On SQLite this relies on app.py emitting BEGIN itself; otherwise pysqlite
+    would commit the savepoint on release when the caller has only read.
+    """
+    if db.session().in_transaction():
+        return db.session.begin_nested()
+    return db.session.begin()
 
 def backup_database(backup_path=None):
     """
     Create a backup of the database and settings.
     
+    Rows are encoded and written as they are fetched, so the whole
+    database is never held in memory at once.
+    
     Args:
         backup_path: Path to save backup file
         
@@ -60,58 +106,38 @@ def backup_database(backup_path=None):
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = f'backup_blog_publisher_{timestamp}.json'
     
-    # Export all data
-    data = {
-        'posts': [],
-        'tags': [],
-        'categories': [],
-        'settings': {}
-    }
+    # Dates stay datetime objects; orjson writes them as ISO 8601 itself
+    posts = (dict(row) for row in _stream_rows(
+        Post.title, Post.content, Post.status, Post.created_date, Post.published_date,
+        Post.blog_target, Post.external_id, Post.tags, Post.categories
+    ))
     
-    # Export posts
-    posts = Post.query.all()
-    for post in posts:
-        data['posts'].append({
-            'title': post.title,
-            'content': post.content,
-            'status': post.status,
-            'created_date': post.created_date.isoformat(),
-            'published_date': post.published_date.isoformat() if post.published_date else None,
-            'blog_target': post.blog_target,
-            'external_id': post.external_id,
-            'tags': post.tags,
-            'categories': post.categories
-        })
-    
-    # Export tags
-    tags = AvailableTag.query.all()
-    for tag in tags:
-        data['tags'].append({
-            'name': tag.name,
-            'description': tag.description,
-            'usage_count': tag.usage_count,
-            'created_date': tag.created_date.isoformat()
-        })
-    
-    # Export categories
-    categories = AvailableCategory.query.all()
-    for category in categories:
-        data['categories'].append({
-            'name': category.name,
-            'description': category.description,
-            'usage_count': category.usage_count,
-            'created_date': category.created_date.isoformat()
-        })
+    tags = (dict(row) for row in _stream_rows(
+        AvailableTag.name, AvailableTag.description, AvailableTag.usage_count, AvailableTag.created_date
+    ))
+    
+    categories = (dict(row) for row in _stream_rows(
+        AvailableCategory.name, AvailableCategory.description, AvailableCategory.usage_count,
+        AvailableCategory.created_date
+    ))
     
     # Export settings (excluding sensitive data)
-    settings = Setting.query.all()
-    for setting in settings:
-        if not setting.key.endswith('_password') and not setting.key.endswith('_secret'):
-            data['settings'][setting.key] = setting.value
+    settings = dict(db.session.query(Setting.key, Setting.value).filter(
+        ~Setting.key.like('%\\_password', escape='\\'),
+        ~Setting.key.like('%\\_secret', escape='\\')
+    ))
     
-    # Save to file
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Save to file, streaming each section
+    with open(backup_path, 'wb', buffering=BACKUP_BUFFER_SIZE) as f:
+        f.write(b'{\n"posts": ')
+        _write_json_array(f, posts)
+        f.write(b',\n"tags": ')
+        _write_json_array(f, tags)
+        f.write(b',\n"categories": ')
+        _write_json_array(f, categories)
+        f.write(b',\n"settings": ')
+        f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+        f.write(b'\n}\n')
     
     return backup_path
 
@@ -119,6 +145,9 @@ def restore_database(backup_path):
     """
     Restore database from backup file.
     
+    Runs as one unit: its own transaction, or a savepoint that the caller
+    commits when called inside an open transaction.
+    
     Args:
         backup_path: Path to backup file
         
@@ -129,8 +158,11 @@ def restore_database(backup_path):
         return {'success': False, 'error': 'Backup file not found'}
     
     try:
-        with open(backup_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Parse straight from the mapped file instead of copying it into a str first
+        with open(backup_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
         
         # Clear existing data (optional - you might want to merge instead)
         # Post.query.delete()
@@ -144,57 +176,75 @@ def restore_database(backup_path):
             'settings': 0
         }
         
-        # Restore tags
-        for tag_data in data.get('tags', []):
-            if not AvailableTag.query.filter_by(name=tag_data['name']).first():
-                tag = AvailableTag(
-                    name=tag_data['name'],
-                    description=tag_data.get('description', ''),
-                    usage_count=tag_data.get('usage_count', 0)
-                )
-                db.session.add(tag)
-                results['tags'] += 1
-        
-        # Restore categories
-        for cat_data in data.get('categories', []):
-            if not AvailableCategory.query.filter_by(name=cat_data['name']).first():
-                category = AvailableCategory(
-                    name=cat_data['name'],
-                    description=cat_data.get('description', ''),
-                    usage_count=cat_data.get('usage_count', 0)
-                )
-                db.session.add(category)
-                results['categories'] += 1
+        # Everything below is applied together, or rolled back together on error
+        with db.session.no_autoflush, _transaction():
+            # Restore tags, skipping names that already exist
+            existing_tags = {name for name, in db.session.query(AvailableTag.name).all()}
+            new_tags = []
+            for tag_data in data.get('tags', []):
+                if tag_data['name'] not in existing_tags:
+                    existing_tags.add(tag_data['name'])
+                    new_tags.append({
+                        'name': tag_data['name'],
+                        'description': tag_data.get('description', ''),
+                        'usage_count': tag_data.get('usage_count', 0)
+                    })
+            db.session.bulk_insert_mappings(AvailableTag, new_tags)
+            results['tags'] = len(new_tags)
+            
+            # Restore categories, skipping names that already exist
+            existing_categories = {name for name, in db.session.query(AvailableCategory.name).all()}
+            new_categories = []
+            for cat_data in data.get('categories', []):
+                if cat_data['name'] not in existing_categories:
+                    existing_categories.add(cat_data['name'])
+                    new_categories.append({
+                        'name': cat_data['name'],
+                        'description': cat_data.get('description', ''),
+                        'usage_count': cat_data.get('usage_count', 0)
+                    })
+            db.session.bulk_insert_mappings(AvailableCategory, new_categories)
+            results['categories'] = len(new_categories)
+            
+            # Restore posts
+            new_posts = [{
+                'title': post_data['title'],
+                'content': post_data['content'],
+                'status': post_data.get('status', 'draft'),
+                'blog_target': post_data.get('blog_target'),
+                'external_id': post_data.get('external_id'),
+                'tags': post_data.get('tags', ''),
+                'categories': post_data.get('categories', '')
+            } for post_data in data.get('posts', [])]
+            db.session.bulk_insert_mappings(Post, new_posts)
+            results['posts'] = len(new_posts)
+            # Bulk inserts skip relationships, so link the restored posts to their tags here
+            link_post_tags()
+            
+            # Restore settings with a single upsert. posts_mtime is set last, overriding any
+            # backed-up value, so cached dashboards are rebuilt with the restored posts
+            settings = data.get('settings', {})
+            stmt = sqlite_insert(Setting).values([
+                {'key': key, 'value': value}
+                for key, value in {**settings, 'posts_mtime': str(time.time())}.items()
+            ])
+            db.session.execute(stmt.on_conflict_do_update(
+                index_elements=[Setting.key],
+                set_={'value': stmt.excluded.value}
+            ))
+            results['settings'] = len(settings)
         
-        # Restore posts
-        for post_data in data.get('posts', []):
-            post = Post(
-                title=post_data['title'],
-                content=post_data['content'],
-                status=post_data.get('status', 'draft'),
-                blog_target=post_data.get('blog_target'),
-                external_id=post_data.get('external_id'),
-                tags=post_data.get('tags', ''),
-                categories=post_data.get('categories', '')
-            )
-            db.session.add(post)
-            results['posts'] += 1
-        
-        # Restore settings
-        for key, value in data.get('settings', {}).items():
-            Setting.set(key, value)
-            results['settings'] += 1
-        
-        db.session.commit()
+        # The upsert bypassed Setting.set, so drop any cached values
+        Setting.clear_cache()
         
         return {'success': True, 'results': results}
     
     except Exception as e:
-        db.session.rollback()
+        # The transaction or savepoint has already rolled itself back
         return {'success': False, 'error': str(e)}
 
 def init_default_tags():
-    """Initialize some default tags for new installations."""
+    """Initialize some default tags for new installations. Inside an open transaction the caller commits."""
     default_tags = [
         ('tutorial', 'Step-by-step guides and tutorials'),
         ('howto', 'How-to guides and instructions'),
@@ -216,23 +266,65 @@ def init_default_tags():
         ('Projects', 'Project showcases and updates')
     ]
     
-    for tag_name, description in default_tags:
-        AvailableTag.add_tag(tag_name, description)
-    
-    for cat_name, description in default_categories:
-        AvailableCategory.add_category(cat_name, description)
+    # One transaction (or savepoint, if the caller has one open) for every insert
+    with db.session.no_autoflush, _transaction():
+        for model, defaults in ((AvailableTag, default_tags), (AvailableCategory, default_categories)):
+            # One lookup for names already present, then one executemany for the rest
+            names = [name for name, _ in defaults]
+            existing = {name for name, in db.session.query(model.name).filter(model.name.in_(names))}
+            rows = [{'name': name, 'description': description}
+                    for name, description in defaults if name not in existing]
+            if rows:
+                db.session.execute(db.insert(model), rows)
 
 def get_app_info():
     """Get application information."""
     from . import __version__, __author__
+    status_counts = dict(db.session.query(Post.status, db.func.count()).group_by(Post.status).all())
     return {
         'version': __version__,
         'author': __author__,
         'python_version': f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}",
         'database_path': Setting.get('database_path', 'Unknown'),
-        'total_posts': Post.query.count(),
+        'total_posts': sum(status_counts.values()),
         'total_tags': AvailableTag.query.count(),
         'total_categories': AvailableCategory.query.count(),
-        'published_posts': Post.query.filter_by(status='published').count(),
-        'draft_posts': Post.query.filter_by(status='draft').count(),
-    }
\ No newline at end of file
+        'published_posts': status_counts.get('published', 0),
+        'draft_posts': status_counts.get('draft', 0),
+    }
+
+# tests/test_utils.py
+"""Tests for blog_publisher.utils."""
+
+import pytest
+from blog_publisher import create_app
+from blog_publisher.app import db
+from blog_publisher.models import Post, AvailableTag
+from blog_publisher.utils import backup_database, restore_database, init_default_tags
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    with app.app_context():
+        yield app
+
+def test_init_default_tags_commits_without_caller_transaction(app):
+    init_default_tags()
+    db.session.rollback()
+    assert AvailableTag.query.count() == 10
+
+def test_init_default_tags_rolls_back_with_caller(app):
+    AvailableTag.query.count()  # the caller has only read so far
+    init_default_tags()
+    db.session.rollback()
+    assert AvailableTag.query.count() == 0
+
+def test_restore_rolls_back_with_caller(app, tmp_path):
+    db.session.add(Post(title='First', content='Body'))
+    db.session.commit()
+    backup_path = backup_database(str(tmp_path / 'backup.json'))
+    
+    Post.query.count()
+    assert restore_database(backup_path)['success']
+    db.session.rollback()
+    assert Post.query.count() == 1
@@ -77,11 +77,19 @@ class Config:
     
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         f'sqlite:///{INSTANCE_PATH / "blog_publisher.db"}'
+    
+    # Per-process cache for rendered pages
+    CACHE_TYPE = 'SimpleCache'
+    CACHE_DEFAULT_TIMEOUT = 60
+    
+    # Create tables on startup instead of via `flask init-db`
+    AUTO_CREATE_TABLES = os.environ.get('AUTO_CREATE_TABLES', 'False').lower() == 'true'
 
 class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
     DEVELOPMENT = True
+    AUTO_CREATE_TABLES = True
 
 class ProductionConfig(Config):
     """Production configuration."""
@@ -93,6 +101,8 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
+    CACHE_TYPE = 'NullCache'
+    AUTO_CREATE_TABLES = True
 
 config = {
     'development': DevelopmentConfig,
@@ -102,22 +112,88 @@ config = {
 }
 
 # blog_publisher/app.py
-from flask import Flask
+import orjson
+from flask import Flask, g, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 from .config import config
 
 # Initialize extensions
 db = SQLAlchemy()
+cache = Cache()
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json module."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply per-connection SQLite settings tuned for many small commits."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-64000')
+    # SQLite ignores ON DELETE CASCADE unless foreign keys are enabled on each connection
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+    # pysqlite defers BEGIN until the first write, so a savepoint opened after only reads
+    # would commit on release; let SQLAlchemy emit BEGIN itself instead
+    dbapi_connection.isolation_level = None
+
+def _begin_sqlite_transaction(conn):
+    """Start the real transaction that pysqlite would otherwise leave out."""
+    conn.exec_driver_sql('BEGIN')
+
+# Requests running more queries than this are logged while developing; usually a lazy load per row
+QUERY_WARN_THRESHOLD = 20
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    """Count the statements each request sends to the database."""
+    if has_request_context():
+        g.query_count = g.get('query_count', 0) + 1
 
 def create_app(config_name='default'):
     """Application factory pattern."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Load configuration
     app.config.from_object(config[config_name])
     
     # Initialize extensions
     db.init_app(app)
+    cache.init_app(app)
+    
+    # WAL lets readers run alongside the writer and makes each commit a cheap append
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', _set_sqlite_pragmas)
+            event.listen(db.engine, 'begin', _begin_sqlite_transaction)
+    
+    # Flag requests whose query count suggests a lazy load per row (N+1 queries) while developing
+    if app.config.get('DEVELOPMENT'):
+        with app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', _count_query)
+        
+        @app.after_request
+        def log_query_count(response):
+            count = g.get('query_count', 0)
+            if count > QUERY_WARN_THRESHOLD:
+                app.logger.warning('%s %s ran %d queries', request.method, request.path, count)
+            return response
+    
+    # Load all settings once per request so Setting.get never hits the database
+    @app.before_request
+    def load_settings():
+        from .models import Setting
+        g.settings = Setting.load_all()
     
     # Register blueprints
     from .routes.main import main_bp
@@ -130,38 +206,140 @@ def create_app(config_name='default'):
     app.register_blueprint(tags_bp, url_prefix='/tags')
     app.register_blueprint(api_bp, url_prefix='/api')
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    @app.cli.command('init-db')
+    def init_db():
+        """Create database tables and indexes."""
+        create_tables()
+    
+    # Creating tables on startup is a development convenience; deployments run `flask init-db`
+    if app.config.get('AUTO_CREATE_TABLES'):
+        with app.app_context():
+            create_tables()
     
     return app
 
+def create_tables():
+    """Create missing tables and indexes. Must run inside an app context."""
+    db.create_all()
+    # create_all skips existing tables, so add any indexes missing from older databases
+    from .models import Post
+    for index in Post.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    # Posts saved before post_tags existed only have their comma-separated tag names
+    from .models import link_post_tags
+    link_post_tags()
+    db.session.commit()
+
 # blog_publisher/models.py
+import re
 from datetime import datetime
+from flask import g, has_app_context
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from .app import db
 
+# One regex pass yields trimmed, non-empty names from a comma-separated string
+_CSV_RE = re.compile(r'[^,\s][^,]*[^,\s]|[^,\s]')
+
+def split_csv(value):
+    """Split a comma-separated label string into trimmed, non-empty names."""
+    return _CSV_RE.findall(value) if value else []
+
+# Settings cache used outside requests (None marks a key with no stored value)
+_SETTING_CACHE = {}
+
+def _request_settings():
+    """Return the settings snapshot loaded for the current request, if any."""
+    if has_app_context() and 'settings' in g:
+        return g.settings
+    return None
+
 class Setting(db.Model):
     """Application settings storage."""
     id = db.Column(db.Integer, primary_key=True)
     key = db.Column(db.String(100), unique=True, nullable=False)
     value = db.Column(db.Text)
     
+    @staticmethod
+    def load_all():
+        """Load every setting into a dict with a single query."""
+        return dict(db.session.query(Setting.key, Setting.value).all())
+    
     @staticmethod
     def get(key, default=None):
         """Get a setting value."""
-        setting = Setting.query.filter_by(key=key).first()
-        return setting.value if setting else default
+        snapshot = _request_settings()
+        if snapshot is not None:
+            value = snapshot.get(key)
+        else:
+            if key not in _SETTING_CACHE:
+                setting = Setting.query.filter_by(key=key).first()
+                _SETTING_CACHE[key] = setting.value if setting else None
+            value = _SETTING_CACHE[key]
+        return value if value is not None else default
+    
+    @staticmethod
+    def get_many(keys):
+        """Get several setting values with a single query."""
+        snapshot = _request_settings()
+        if snapshot is not None:
+            return {key: snapshot.get(key) for key in keys}
+        missing = [key for key in keys if key not in _SETTING_CACHE]
+        if missing:
+            found = {s.key: s.value for s in Setting.query.filter(Setting.key.in_(missing)).all()}
+            for key in missing:
+                _SETTING_CACHE[key] = found.get(key)
+        return {key: _SETTING_CACHE[key] for key in keys}
     
     @staticmethod
     def set(key, value):
-        """Set a setting value."""
+        """Set a setting value. The caller commits."""
         setting = Setting.query.filter_by(key=key).first()
         if setting:
             setting.value = value
         else:
             setting = Setting(key=key, value=value)
             db.session.add(setting)
-        db.session.commit()
+        db.session.flush()
+        Setting._remember({key: value})
+    
+    @staticmethod
+    def set_many(mapping):
+        """Set several setting values at once. The caller commits."""
+        existing = {s.key: s for s in Setting.query.filter(Setting.key.in_(mapping)).all()}
+        for key, value in mapping.items():
+            if key in existing:
+                existing[key].value = value
+            else:
+                db.session.add(Setting(key=key, value=value))
+        db.session.flush()
+        Setting._remember(mapping)
+    
+    @staticmethod
+    def _remember(mapping):
+        """Reflect written values in the request snapshot now, and in the process cache once committed."""
+        snapshot = _request_settings()
+        if snapshot is not None:
+            snapshot.update(mapping)
+        db.session.info.setdefault('pending_settings', {}).update(mapping)
+    
+    @staticmethod
+    def clear_cache():
+        """Forget cached values after writes that bypass Setting.set."""
+        _SETTING_CACHE.clear()
+        if has_app_context():
+            g.pop('settings', None)
+
+@event.listens_for(db.session, 'after_commit')
+def _cache_committed_settings(session):
+    """Publish values written by Setting.set to other requests once they are committed."""
+    _SETTING_CACHE.update(session.info.pop('pending_settings', {}))
+
+@event.listens_for(db.session, 'after_rollback')
+def _forget_pending_settings(session):
+    """Drop rolled-back values so the next read goes back to the database."""
+    for key in session.info.pop('pending_settings', {}):
+        _SETTING_CACHE.pop(key, None)
 
 class AvailableTag(db.Model):
     """Available tags for posts."""
@@ -174,31 +352,41 @@ class AvailableTag(db.Model):
     @staticmethod
     def get_all_tags():
         """Get all tags ordered by usage count."""
-        return AvailableTag.query.order_by(AvailableTag.usage_count.desc()).all()
+        return db.session.execute(db.select(AvailableTag).order_by(AvailableTag.usage_count.desc())).scalars().all()
     
     @staticmethod
     def add_tag(name, description=''):
-        """Add a new tag."""
-        tag = AvailableTag.query.filter_by(name=name.strip()).first()
-        if not tag:
-            tag = AvailableTag(name=name.strip(), description=description)
-            db.session.add(tag)
-            db.session.commit()
-        return tag
+        """Add a new tag, or return the existing one with that name. The caller commits."""
+        name = name.strip()
+        db.session.execute(
+            sqlite_insert(AvailableTag)
+            .values(name=name, description=description)
+            .on_conflict_do_nothing(index_elements=['name'])
+        )
+        return AvailableTag.query.filter_by(name=name).first()
     
     @staticmethod
-    def increment_usage(tag_names):
-        """Increment usage count for tags."""
-        if not tag_names:
+    def increment_usage(post):
+        """Link a post to its tags, adding new ones, and increment their usage counts."""
+        if not post.tags:
+            post.tag_objs = []
             return
-        tag_list = [tag.strip() for tag in tag_names.split(',') if tag.strip()]
-        for tag_name in tag_list:
-            tag = AvailableTag.query.filter_by(name=tag_name).first()
-            if tag:
-                tag.usage_count += 1
-            else:
-                # Auto-add new tags
-                AvailableTag.add_tag(tag_name)
+        tag_list = list(dict.fromkeys(split_csv(post.tags)))
+        existing = {tag.name: tag for tag in AvailableTag.query.filter(AvailableTag.name.in_(tag_list)).all()}
+        # Auto-add new tags
+        for name in tag_list:
+            if name not in existing:
+                existing[name] = AvailableTag(name=name, usage_count=0)
+                db.session.add(existing[name])
+        post.tag_objs = [existing[name] for name in tag_list]
+        db.session.flush()
+        linked = db.select(post_tags.c.tag_id).where(post_tags.c.post_id == post.id)
+        db.session.execute(
+            db.update(AvailableTag)
+            .where(AvailableTag.id.in_(linked))
+            .values(usage_count=AvailableTag.usage_count + 1)
+            .execution_options(synchronize_session=False)
+        )
         db.session.commit()
 
 class AvailableCategory(db.Model):
@@ -212,49 +400,82 @@ class AvailableCategory(db.Model):
     @staticmethod
     def get_all_categories():
         """Get all categories ordered by usage count."""
-        return AvailableCategory.query.order_by(AvailableCategory.usage_count.desc()).all()
+        return db.session.execute(db.select(AvailableCategory).order_by(AvailableCategory.usage_count.desc())).scalars().all()
     
     @staticmethod
     def add_category(name, description=''):
-        """Add a new category."""
-        category = AvailableCategory.query.filter_by(name=name.strip()).first()
-        if not category:
-            category = AvailableCategory(name=name.strip(), description=description)
-            db.session.add(category)
-            db.session.commit()
-        return category
+        """Add a new category, or return the existing one with that name. The caller commits."""
+        name = name.strip()
+        db.session.execute(
+            sqlite_insert(AvailableCategory)
+            .values(name=name, description=description)
+            .on_conflict_do_nothing(index_elements=['name'])
+        )
+        return AvailableCategory.query.filter_by(name=name).first()
     
     @staticmethod
     def increment_usage(category_names):
         """Increment usage count for categories."""
         if not category_names:
             return
-        category_list = [cat.strip() for cat in category_names.split(',') if cat.strip()]
-        for category_name in category_list:
-            category = AvailableCategory.query.filter_by(name=category_name).first()
-            if category:
-                category.usage_count += 1
-            else:
-                # Auto-add new categories
-                AvailableCategory.add_category(category_name)
+        category_list = list(dict.fromkeys(split_csv(category_names)))
+        existing = {cat.name for cat in AvailableCategory.query.filter(AvailableCategory.name.in_(category_list)).all()}
+        if existing:
+            db.session.query(AvailableCategory).filter(AvailableCategory.name.in_(existing)).update(
+                {AvailableCategory.usage_count: AvailableCategory.usage_count + 1},
+                synchronize_session=False
+            )
+        # Auto-add new categories
+        missing = [name for name in category_list if name not in existing]
+        if missing:
+            db.session.bulk_save_objects([AvailableCategory(name=name, usage_count=1) for name in missing])
         db.session.commit()
 
+# Association between posts and their tags; the tag_id index serves "posts with tag X" lookups
+post_tags = db.Table(
+    'post_tags',
+    db.Column('post_id', db.Integer, db.ForeignKey('post.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('available_tag.id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_post_tags_tag', 'tag_id')
+)
+
 class Post(db.Model):
     """Blog post model."""
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
-    status = db.Column(db.String(20), default='draft')  # draft, published, scheduled
+    status = db.Column(db.String(20), default='draft', index=True)  # draft, published, scheduled
     created_date = db.Column(db.DateTime, default=datetime.utcnow)
     published_date = db.Column(db.DateTime)
     blog_target = db.Column(db.String(50))  # blogger, wordpress
     external_id = db.Column(db.String(100))  # ID from the blog platform
     tags = db.Column(db.String(500))
     categories = db.Column(db.String(500))
+    # Loaded only when accessed; list views read the tags column instead
+    tag_objs = db.relationship('AvailableTag', secondary=post_tags, lazy='select', passive_deletes=True)
+    
+    __table_args__ = (
+        db.Index('ix_post_created_desc', created_date.desc()),
+        db.Index('ix_post_status_created', status, created_date.desc()),
+    )
     
     def __repr__(self):
         return f'<Post {self.title}>'
 
+def link_post_tags():
+    """Link posts that have no post_tags rows to their known tags by name. The caller commits."""
+    tag_ids = dict(db.session.query(AvailableTag.name, AvailableTag.id))
+    unlinked = db.session.query(Post.id, Post.tags).filter(
+        Post.tags.isnot(None), Post.tags != '',
+        Post.id.not_in(db.select(post_tags.c.post_id))
+    )
+    rows = [{'post_id': post_id, 'tag_id': tag_ids[name]}
+            for post_id, tags in unlinked
+            for name in dict.fromkeys(split_csv(tags)) if name in tag_ids]
+    if rows:
+        db.session.execute(post_tags.insert(), rows)
+    return len(rows)
+
 # blog_publisher/cli.py
 import os
 import click
@@ -2,21 +2,46 @@
 """Route blueprints for the blog publisher application."""
 
 # blog_publisher/routes/main.py
-from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask import Blueprint, render_template, redirect, url_for, flash, request, session
 from ..models import Setting, Post
-from ..app import db
+from ..app import db, cache
 
 main_bp = Blueprint('main', __name__)
 
+# Dashboard page size and the number of content characters shown per card
+POSTS_PER_PAGE = 25
+POST_PREVIEW_LENGTH = 150
+
+def _index_cache_key():
+    """Cache key per dashboard page that changes whenever a post is saved, published or deleted."""
+    page = request.args.get('page', 1, type=int)
+    return f"idx:{Setting.get('posts_mtime', '0')}:{page}"
+
+def _skip_index_cache():
+    """Bypass the cache for setup redirects and pages carrying flash messages."""
+    return not Setting.get('configured') or '_flashes' in session
+
 @main_bp.route('/')
+@cache.cached(timeout=60, key_prefix=_index_cache_key, unless=_skip_index_cache)
 def index():
     """Main dashboard showing all posts."""
     # Check if app is configured
     if not Setting.get('configured'):
         return redirect(url_for('main.setup'))
     
-    posts = Post.query.order_by(Post.created_date.desc()).all()
-    return render_template('index.html', posts=posts)
+    # Only select what the dashboard cards show; full content stays in the database
+    page = request.args.get('page', 1, type=int)
+    posts = Post.query.with_entities(
+        Post.id,
+        Post.title,
+        Post.status,
+        Post.created_date,
+        Post.published_date,
+        Post.blog_target,
+        db.func.substr(Post.content, 1, POST_PREVIEW_LENGTH).label('preview'),
+        db.func.length(Post.content).label('content_length')
+    ).order_by(Post.created_date.desc()).paginate(page=page, per_page=POSTS_PER_PAGE, error_out=False)
+    return render_template('index.html', posts=posts, preview_length=POST_PREVIEW_LENGTH)
 
 @main_bp.route('/setup')
 def setup():
@@ -28,18 +53,20 @@ def setup_post():
     """Handle setup form submission."""
     # Save blog configuration
     blog_type = request.form.get('blog_type')
-    Setting.set('blog_type', blog_type)
+    form_settings = {'blog_type': blog_type}
     
     if blog_type == 'blogger':
-        Setting.set('blogger_blog_id', request.form.get('blogger_blog_id'))
-        Setting.set('blogger_client_id', request.form.get('blogger_client_id'))
-        Setting.set('blogger_client_secret', request.form.get('blogger_client_secret'))
+        form_settings['blogger_blog_id'] = request.form.get('blogger_blog_id')
+        form_settings['blogger_client_id'] = request.form.get('blogger_client_id')
+        form_settings['blogger_client_secret'] = request.form.get('blogger_client_secret')
     elif blog_type == 'wordpress':
-        Setting.set('wordpress_url', request.form.get('wordpress_url'))
-        Setting.set('wordpress_username', request.form.get('wordpress_username'))
-        Setting.set('wordpress_password', request.form.get('wordpress_password'))
+        form_settings['wordpress_url'] = request.form.get('wordpress_url')
+        form_settings['wordpress_username'] = request.form.get('wordpress_username')
+        form_settings['wordpress_password'] = request.form.get('wordpress_password')
     
-    Setting.set('configured', 'true')
+    form_settings['configured'] = 'true'
+    Setting.set_many(form_settings)
+    db.session.commit()
     flash('Configuration saved successfully!', 'success')
     return redirect(url_for('main.index'))
 
@@ -59,29 +86,35 @@ def settings():
 def settings_post():
     """Handle settings form submission."""
     blog_type = request.form.get('blog_type')
-    Setting.set('blog_type', blog_type)
+    form_settings = {'blog_type': blog_type}
     
     if blog_type == 'blogger':
-        Setting.set('blogger_blog_id', request.form.get('blogger_blog_id'))
-        Setting.set('blogger_client_id', request.form.get('blogger_client_id'))
-        Setting.set('blogger_client_secret', request.form.get('blogger_client_secret'))
+        form_settings['blogger_blog_id'] = request.form.get('blogger_blog_id')
+        form_settings['blogger_client_id'] = request.form.get('blogger_client_id')
+        form_settings['blogger_client_secret'] = request.form.get('blogger_client_secret')
     elif blog_type == 'wordpress':
-        Setting.set('wordpress_url', request.form.get('wordpress_url'))
-        Setting.set('wordpress_username', request.form.get('wordpress_username'))
-        Setting.set('wordpress_password', request.form.get('wordpress_password'))
+        form_settings['wordpress_url'] = request.form.get('wordpress_url')
+        form_settings['wordpress_username'] = request.form.get('wordpress_username')
+        form_settings['wordpress_password'] = request.form.get('wordpress_password')
     
+    Setting.set_many(form_settings)
+    db.session.commit()
     flash('Settings updated successfully!', 'success')
     return redirect(url_for('main.settings'))
 
 # blog_publisher/routes/posts.py
+import time
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from datetime import datetime
 from ..models import Post, Setting, AvailableTag, AvailableCategory
-from ..api.publishers import BlogAPI
 from ..app import db
 
 posts_bp = Blueprint('posts', __name__)
 
+def _touch_posts():
+    """Record that posts changed so the cached dashboard is rebuilt."""
+    Setting.set('posts_mtime', str(time.time()))
+
 @posts_bp.route('/new')
 def new_post():
     """Create new post page."""
@@ -90,7 +123,7 @@ def new_post():
 @posts_bp.route('/edit/<int:post_id>')
 def edit_post(post_id):
     """Edit existing post page."""
-    post = Post.query.get_or_404(post_id)
+    post = db.get_or_404(Post, post_id)
     return render_template('editor.html', post=post)
 
 @posts_bp.route('/save', methods=['POST'])
@@ -99,7 +132,7 @@ def save_post():
     data = request.get_json()
     
     if data.get('id'):
-        post = Post.query.get(data['id'])
+        post = db.get_or_404(Post, data['id'])
         post.title = data['title']
         post.content = data['content']
         post.tags = data.get('tags', '')
@@ -115,9 +148,10 @@ def save_post():
         db.session.add(post)
     
     # Update tag and category usage counts
-    AvailableTag.increment_usage(post.tags)
+    AvailableTag.increment_usage(post)
     AvailableCategory.increment_usage(post.categories)
     
+    _touch_posts()
     db.session.commit()
     return jsonify({'success': True, 'id': post.id})
 
@@ -130,7 +164,7 @@ def publish_post():
     if not post_id:
         return jsonify({'success': False, 'error': 'Post ID required'})
     
-    post = Post.query.get(post_id)
+    post = db.session.get(Post, post_id)
     if not post:
         return jsonify({'success': False, 'error': 'Post not found'})
     
@@ -141,6 +175,8 @@ def publish_post():
             # This would require OAuth2 flow implementation
             external_id = 'blogger_post_id'  # Placeholder
         elif blog_type == 'wordpress':
+            # Imported here so the HTTP/OAuth stack loads only when publishing
+            from ..api.publishers import BlogAPI
             external_id = BlogAPI.publish_to_wordpress(post)
         else:
             return jsonify({'success': False, 'error': 'No blog platform configured'})
@@ -148,6 +184,7 @@ def publish_post():
         post.status = 'published'
         post.published_date = datetime.utcnow()
         post.external_id = str(external_id)
+        _touch_posts()
         db.session.commit()
         
         return jsonify({'success': True, 'message': 'Post published successfully!'})
@@ -158,8 +195,9 @@ def publish_post():
 @posts_bp.route('/delete/<int:post_id>', methods=['POST'])
 def delete_post(post_id):
     """Delete a post."""
-    post = Post.query.get_or_404(post_id)
+    post = db.get_or_404(Post, post_id)
     db.session.delete(post)
+    _touch_posts()
     db.session.commit()
     flash('Post deleted successfully!', 'success')
     return redirect(url_for('main.index'))
@@ -188,21 +226,19 @@ def add_tag():
     if not tag_name:
         return jsonify({'success': False, 'error': 'Tag name is required'})
     
-    try:
-        tag = AvailableTag.add_tag(tag_name, description)
-        return jsonify({'success': True, 'tag': {
-            'id': tag.id,
-            'name': tag.name,
-            'description': tag.description,
-            'usage_count': tag.usage_count
-        }})
-    except Exception as e:
-        return jsonify({'success': False, 'error': 'Tag already exists'})
+    tag = AvailableTag.add_tag(tag_name, description)
+    db.session.commit()
+    return jsonify({'success': True, 'tag': {
+        'id': tag.id,
+        'name': tag.name,
+        'description': tag.description,
+        'usage_count': tag.usage_count
+    }})
 
 @tags_bp.route('/delete/<int:tag_id>', methods=['POST'])
 def delete_tag(tag_id):
     """Delete a tag."""
-    tag = AvailableTag.query.get_or_404(tag_id)
+    tag = db.get_or_404(AvailableTag, tag_id)
     db.session.delete(tag)
     db.session.commit()
     return jsonify({'success': True})
@@ -217,27 +253,26 @@ def add_category():
     if not category_name:
         return jsonify({'success': False, 'error': 'Category name is required'})
     
-    try:
-        category = AvailableCategory.add_category(category_name, description)
-        return jsonify({'success': True, 'category': {
-            'id': category.id,
-            'name': category.name,
-            'description': category.description,
-            'usage_count': category.usage_count
-        }})
-    except Exception as e:
-        return jsonify({'success': False, 'error': 'Category already exists'})
+    category = AvailableCategory.add_category(category_name, description)
+    db.session.commit()
+    return jsonify({'success': True, 'category': {
+        'id': category.id,
+        'name': category.name,
+        'description': category.description,
+        'usage_count': category.usage_count
+    }})
 
 @tags_bp.route('/categories/delete/<int:category_id>', methods=['POST'])
 def delete_category(category_id):
     """Delete a category."""
-    category = AvailableCategory.query.get_or_404(category_id)
+    category = db.get_or_404(AvailableCategory, category_id)
     db.session.delete(category)
     db.session.commit()
     return jsonify({'success': True})
 
 # blog_publisher/routes/api.py
 from flask import Blueprint, jsonify
+from ..app import db
 from ..models import AvailableTag, AvailableCategory
 
 api_bp = Blueprint('api', __name__)
@@ -245,19 +280,17 @@ api_bp = Blueprint('api', __name__)
 @api_bp.route('/tags')
 def get_tags():
     """Get all available tags."""
-    tags = AvailableTag.get_all_tags()
-    return jsonify([{
-        'name': tag.name, 
-        'usage_count': tag.usage_count, 
-        'description': tag.description
-    } for tag in tags])
+    rows = db.session.execute(
+        db.select(AvailableTag.name, AvailableTag.usage_count, AvailableTag.description)
+        .order_by(AvailableTag.usage_count.desc())
+    ).mappings().all()
+    return jsonify([dict(row) for row in rows])
 
 @api_bp.route('/categories')
 def get_categories():
     """Get all available categories."""
-    categories = AvailableCategory.get_all_categories()
-    return jsonify([{
-        'name': cat.name, 
-        'usage_count': cat.usage_count, 
-        'description': cat.description
-    } for cat in categories])
\ No newline at end of file
+    rows = db.session.execute(
+        db.select(AvailableCategory.name, AvailableCategory.usage_count, AvailableCategory.description)
+        .order_by(AvailableCategory.usage_count.desc())
+    ).mappings().all()
+    return jsonify([dict(row) for row in rows])
\ No newline at end of file
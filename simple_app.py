@@ -1,119 +1,208 @@
 # simple_app.py (Starting Mode App for Gunicorn)
-from flask import Flask, render_template_string
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import parse_accept_header, parse_etags
+import functools
+import gc
+import gzip
+import hashlib
 import os
+import re
+import sys
+import orjson
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json module."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Create the Flask application instance
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'dev-key'
 
+AVAILABLE_MODES = ('starting', 'development', 'production')
+
 # Read the application mode from the environment variable
-mode = os.environ.get('APP_MODE', 'starting')
-
-# Define the HTML template for the starting page
-STARTING_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Blog Publisher - {{ mode|title }} Mode</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-    <style>
-        .mode-container {
-            min-height: 100vh;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 2rem 0;
-        }
-        .mode-card {
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            padding: 2rem;
-            margin: 1rem;
-        }
-        .mode-indicator {
-            display: inline-block;
-            padding: 0.5rem 1rem;
-            border-radius: 25px;
-            font-weight: bold;
-            margin-bottom: 1rem;
-        }
-        .mode-starting { background: #e3f2fd; color: #1976d2; }
-        .mode-development { background: #fff3e0; color: #f57c00; }
-        .mode-production { background: #e8f5e8; color: #388e3c; }
-    </style>
-</head>
-<body>
-    <div class="mode-container">
-        <div class="container">
-            <div class="row justify-content-center">
-                <div class="col-md-8">
-                    <div class="mode-card text-center">
-                        <span class="mode-indicator mode-{{ mode }}">{{ mode|title }} Mode</span>
-                        <h1 class="display-4 mb-4">🚧 Blog Publisher</h1>
-                        
-                        {% if mode == 'starting' %}
-                            <div class="alert alert-info">
-                                <strong>Starting Mode Active!</strong><br>
-                                Perfect for getting your feet wet. Simple Flask app running.
-                            </div>
-                            <h3>Ready to switch modes?</h3>
-                            <p>Edit <code>.env</code> file and change <code>MODE=starting</code> to:</p>
-                            <div class="row mt-4">
-                                <div class="col-md-6">
-                                    <div class="card h-100">
-                                        <div class="card-body">
-                                            <h5>Development Mode</h5>
-                                            <code>MODE=development</code>
-                                            <p class="mt-2">Full dev environment with all tools</p>
-                                        </div>
-                                    </div>
-                                </div>
-                                <div class="col-md-6">
-                                    <div class="card h-100">
-                                        <div class="card-body">
-                                            <h5>Production Mode</h5>
-                                            <code>MODE=production</code>
-                                            <p class="mt-2">Full package installation</p>
-                                        </div>
-                                    </div>
-                                </div>
-                            </div>
-                        {% endif %}
-                        
-                        <div class="mt-4">
-                            <a href="/test" class="btn btn-primary me-2">Test Route</a>
-                            <a href="/mode" class="btn btn-outline-secondary">Mode Info</a>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-'''
+mode = sys.intern(os.environ.get('APP_MODE', 'starting'))
+# Only known modes are accepted, which is what makes it safe to render them unescaped
+if mode not in AVAILABLE_MODES:
+    raise ValueError(f"APP_MODE must be one of {', '.join(AVAILABLE_MODES)}, got {mode!r}")
+
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_INDENT_RE = re.compile(r'\n\s+')
+
+def _minify_html(html):
+    """Drop comments, indentation and blank lines; the page has no <pre> or <textarea> to preserve."""
+    return _INDENT_RE.sub('\n', _HTML_COMMENT_RE.sub('', html)).strip()
+
+# Compile once; the source string is only needed for this step, so it is not kept around
+_src = (Path(app.root_path) / 'templates' / 'starting.html').read_text(encoding='utf-8')
+_STARTING_TPL = app.jinja_env.from_string(_src)
+del _src
+
+@functools.lru_cache(maxsize=len(AVAILABLE_MODES))
+def _render_index(page_mode):
+    """Render the minified starting page for a mode, at most once per mode per process."""
+    return _minify_html(_STARTING_TPL.render(
+        mode=page_mode, mode_title=page_mode.title(), mode_class=f'mode-{page_mode}'
+    )).encode('utf-8')
+
+# mode is fixed for the process lifetime, so the page is rendered once and served as bytes
+_RENDERED_INDEX = _render_index(mode)
+_INDEX_ETAG = hashlib.md5(_RENDERED_INDEX).hexdigest()
+
+# Content codings we can serve, most preferred first
+_INDEX_CODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# Compress at the highest levels once here instead of per response; each
+# representation gets its own ETag since the bytes differ
+_INDEX_VARIANTS = {None: (_RENDERED_INDEX, _INDEX_ETAG)}
+if brotli is not None:
+    _INDEX_VARIANTS['br'] = (brotli.compress(_RENDERED_INDEX, quality=11), f'{_INDEX_ETAG}-br')
+_INDEX_VARIANTS['gzip'] = (gzip.compress(_RENDERED_INDEX, compresslevel=9), f'{_INDEX_ETAG}-gzip')
+
+# Browsers may reuse the page for this long before revalidating with If-None-Match
+INDEX_MAX_AGE = 300
+
+# Behind nginx, set INDEX_ACCEL_DIR to hand the page off with X-Accel-Redirect so nginx
+# sends the file itself. The directory must be served as an internal location, e.g.
+#   location /_internal/ { internal; alias /var/cache/app/; gzip_static on; }
+INDEX_ACCEL_DIR = os.environ.get('INDEX_ACCEL_DIR')
+INDEX_ACCEL_URI = os.environ.get('INDEX_ACCEL_URI', '/_internal/index.html')
 
+def _write_atomic(path, data):
+    """Replace path with data so a concurrently starting worker never exposes a partial file."""
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+if INDEX_ACCEL_DIR:
+    _accel_path = Path(INDEX_ACCEL_DIR) / 'index.html'
+    _accel_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(_accel_path, _RENDERED_INDEX)
+    # Precompressed siblings for nginx's gzip_static / brotli_static
+    for _coding, _suffix in (('gzip', '.gz'), ('br', '.br')):
+        if _coding in _INDEX_VARIANTS:
+            _write_atomic(_accel_path.with_name(_accel_path.name + _suffix), _INDEX_VARIANTS[_coding][0])
+
+def _index_responses(body, etag, coding):
+    """Build the shared 200 and 304 responses for one representation of the page."""
+    full = Response(body, mimetype='text/html', direct_passthrough=True)
+    if coding:
+        full.content_encoding = coding
+    not_modified = Response(status=304)
+    for response in (full, not_modified):
+        response.set_etag(etag)
+        response.vary.add('Accept-Encoding')
+        response.cache_control.public = True
+        response.cache_control.max_age = INDEX_MAX_AGE
+    return etag, full, not_modified
+
+# Every response is built once and returned as the same instance on each request, so nothing
+# may set per-request headers on them (there are no after_request hooks in this app)
+_INDEX_RESPONSES = {
+    coding: _index_responses(body, etag, coding)
+    for coding, (body, etag) in _INDEX_VARIANTS.items()
+}
+_ACCEL_RESPONSE = Response(headers={'X-Accel-Redirect': INDEX_ACCEL_URI}, mimetype='text/html')
+
+# The JSON payloads depend only on mode, so build and serialize them once as well
+_TEST_PAYLOAD = {
+    'status': 'success',
+    'mode': mode,
+    'message': f'Flask is working in {mode} mode!',
+    'container': 'Docker adaptive environment'
+}
+
+_MODE_PAYLOAD = {
+    'current_mode': mode,
+    'available_modes': AVAILABLE_MODES,
+    'switch_instructions': 'Edit .env file and change MODE variable, then: docker-compose up --build -d'
+}
+
+# orjson.dumps already returns UTF-8 bytes, so skip the provider's str round trip
+_TEST_JSON = orjson.dumps(_TEST_PAYLOAD)
+_MODE_JSON = orjson.dumps(_MODE_PAYLOAD)
+
+_TEST_RESPONSE = Response(_TEST_JSON, mimetype='application/json', direct_passthrough=True)
+_MODE_RESPONSE = Response(_MODE_JSON, mimetype='application/json', direct_passthrough=True)
+
+# Views bind their constants as defaults so lookups are locals rather than globals
 @app.route('/')
-def index():
-    return render_template_string(STARTING_TEMPLATE, mode=mode)
+def index(_codings=_INDEX_CODINGS, _responses=_INDEX_RESPONSES):
+    if INDEX_ACCEL_DIR:
+        return _ACCEL_RESPONSE
+    
+    etag, full, not_modified = _responses[request.accept_encodings.best_match(_codings)]
+    return not_modified if request.if_none_match.contains(etag) else full
 
 @app.route('/test')
-def test():
-    return {
-        'status': 'success',
-        'mode': mode,
-        'message': f'Flask is working in {mode} mode!',
-        'container': 'Docker adaptive environment'
-    }
+def test(_response=_TEST_RESPONSE):
+    return _response
 
 @app.route('/mode')
-def mode_info():
-    return {
-        'current_mode': mode,
-        'available_modes': ['starting', 'development', 'production'],
-        'switch_instructions': 'Edit .env file and change MODE variable, then: docker-compose up --build -d'
-    }
+def mode_info(_response=_MODE_RESPONSE):
+    return _response
+
+def _raw(response):
+    """Return the status line, header list and body of a prebuilt response."""
+    return response.status, response.headers.to_wsgi_list(), response.get_data()
+
+# The same prebuilt responses, unpacked once for the raw WSGI entry point below
+_RAW_INDEX = {
+    coding: (etag, _raw(full), _raw(not_modified))
+    for coding, (etag, full, not_modified) in _INDEX_RESPONSES.items()
+}
+_RAW_ROUTES = {
+    '/test': _raw(_TEST_RESPONSE),
+    '/mode': _raw(_MODE_RESPONSE),
+}
+
+def wsgi(environ, start_response):
+    """Serve the fixed routes without Flask's request parsing, routing or hooks.
+    
+    Anything else (other paths and methods, or the X-Accel-Redirect hand-off)
+    falls through to the Flask app, which also serves the same routes when it
+    is run directly.
+    """
+    method = environ['REQUEST_METHOD']
+    if method != 'GET' and method != 'HEAD':
+        return app(environ, start_response)
+    
+    path = environ.get('PATH_INFO')
+    if path == '/' and not INDEX_ACCEL_DIR:
+        coding = parse_accept_header(environ.get('HTTP_ACCEPT_ENCODING')).best_match(_INDEX_CODINGS)
+        etag, full, not_modified = _RAW_INDEX[coding]
+        if parse_etags(environ.get('HTTP_IF_NONE_MATCH')).contains(etag):
+            status, headers, body = not_modified
+        else:
+            status, headers, body = full
+    else:
+        route = _RAW_ROUTES.get(path)
+        if route is None:
+            return app(environ, start_response)
+        status, headers, body = route
+    
+    start_response(status, headers)
+    return [body] if method == 'GET' else []
+
+# Everything above is built once and never changes; move it out of the collector's reach so
+# forked workers don't dirty the shared copy-on-write pages by scanning it
+gc.freeze()
 
 # The 'if __name__ == "__main__":' block is removed because Gunicorn will run the app directly.
-# The 'app' instance is exposed to Gunicorn, which handles the running of the server.
+# The 'wsgi' callable is exposed to Gunicorn, which handles the running of the server.
+# Every route only returns precomputed bytes, so evented workers let one process hold many connections:
+#   gunicorn -k gevent -w $(nproc) --worker-connections 1000 --preload -b 0.0.0.0:5000 simple_app:wsgi
+# --preload imports the module once in the master so workers share its frozen heap.